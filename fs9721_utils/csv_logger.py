@@ -8,7 +8,7 @@ import logging
 from collections import namedtuple
 from csv import writer
 from datetime import datetime
-from typing import Optional, Union
+from typing import Iterable, Optional, Union
 
 from fs9721_utils.reading import NonNumericReadingError, Reading, readable_unit
 
@@ -21,9 +21,7 @@ CSVRow = namedtuple("CSVRow", _CSV_COLUMNS)
 
 Loggable = Union[CSVRow, Reading]
 
-def _parse_reading(reading: Reading) -> CSVRow:
-    read_at = datetime.now()
-
+def _parse_reading(reading: Reading, read_at: datetime) -> CSVRow:
     try:
         value = reading.value()
     except NonNumericReadingError:
@@ -43,7 +41,7 @@ class CSVWriterNotReadyError(Exception):
     """
 
 
-class CSVWriter:
+class CSVWriter:  # pylint: disable=too-many-instance-attributes
     """
     Logger provides a simple wrapper for logging values to a CSV file; handling
     the transformation of values and the management of underlying files.
@@ -51,46 +49,125 @@ class CSVWriter:
     When `filename` is specified it sets the name of the destination CSV file.
     When `auto_reopen` is specified then the CSV file will automatically be opened
     in the event that there's an attempted write and the file has been closed.
+    When `batch_size` is greater than one, rows are buffered in memory and
+    written in batches - useful when replaying captured packets; the default
+    writes each row through immediately.
     """
-    def __init__(self, filename: Optional[str] = None, auto_reopen: bool = False):
+    def __init__(self, filename: Optional[str] = None, auto_reopen: bool = False,
+                 batch_size: int = 1):
         self.auto_reopen = auto_reopen
+        self.batch_size = batch_size
         self.csv = None
         self.writing = False
+        self._buffer = []
+        self._last_second = None
+        self._last_prefix = None
 
         self.filename = filename if filename else f"{datetime.now().isoformat()}-dmm-log.csv"
         self._open()
 
     def _open(self):
         _LOGGER.info("opening CSV file for writing",extra={"filename": self.filename})
-        self.output = open(self.filename, "a") # pylint: disable=consider-using-with,unspecified-encoding
+        self.output = open(self.filename, "a", buffering=65536) # pylint: disable=consider-using-with,unspecified-encoding
         self.csv = writer(self.output)
         self.csv.writerow(_CSV_COLUMNS)
         self.writing = True
+        # Cached so the per-row write path can skip building `extra` dicts
+        # when debug logging is off; refreshed on every (re)open.
+        self._debug = _LOGGER.isEnabledFor(logging.DEBUG)
+
+    def _timestamp(self, moment: datetime) -> str:
+        """
+        Formats a timestamp for a CSV row, caching the (comparatively
+        expensive) seconds-resolution portion of the isoformat string:
+        consecutive rows usually land within the same second, so only the
+        microseconds need reformatting. Timezone-aware timestamps carry
+        their UTC offset after the microseconds, so they skip the cache
+        rather than splice the suffix in mid-string.
+        """
+        if moment.tzinfo is not None:
+            return moment.isoformat()
+
+        second = moment.replace(microsecond=0)
+        if second != self._last_second:
+            self._last_second = second
+            self._last_prefix = second.isoformat()
+
+        if moment.microsecond:
+            return f"{self._last_prefix}.{moment.microsecond:06d}"
+        return self._last_prefix
 
     def log_value(self, value, unit):
         """logs out a key/value pairing of value and unit."""
-        self.log(CSVRow(time=datetime.now(), value=value, unit=unit))
+        self.log_row(CSVRow(time=datetime.now(), value=value, unit=unit))
+
+    def log_reading(self, reading: Reading):
+        """logs out a `Reading` that has been parsed from the device."""
+        self._write(_parse_reading(reading, datetime.now()))
+
+    def log_row(self, row: CSVRow):
+        """logs out a preassembled `CSVRow`."""
+        self._write(row)
 
     def log(self, entry: Loggable):
         """logs out a `Loggable` type - either a `CSVRow` or a `Reading`."""
+        if isinstance(entry, Reading):
+            self.log_reading(entry)
+        else:
+            self.log_row(entry)
+
+    def log_many(self, entries: Iterable[Loggable]):
+        """
+        logs out an iterable of `Loggable` entries as one batch: the whole
+        batch is formatted up-front - any `Reading` entries sharing a single
+        capture timestamp - and written with one flush, regardless of
+        `batch_size`. Suited to replaying captured packets.
+        """
+        self._ensure_writable()
+        now = datetime.now()
+        self._buffer.extend(
+            self._format(_parse_reading(e, now) if isinstance(e, Reading) else e)
+            for e in entries
+        )
+        self._flush()
+
+    def _ensure_writable(self):
         if not self.writing:
-            _LOGGER.warning("attempt to write CSV data when file is unavailable")
+            if _LOGGER.isEnabledFor(logging.WARNING):
+                _LOGGER.warning("attempt to write CSV data when file is unavailable")
             if self.auto_reopen:
                 self._open()
             else:
                 raise CSVWriterNotReadyError
 
-        if isinstance(entry, Reading):
-            entry = _parse_reading(entry)
-
-        row = [entry.time.isoformat(), entry.value, entry.unit]
-        _LOGGER.debug("writing row to CSV file", extra={"row": row})
-        self.csv.writerow(row)
+    def _format(self, entry: CSVRow) -> str:
+        # None of the fields can contain separators or quotes - the timestamp
+        # and unit are known-safe strings and the value is numeric (or "L") -
+        # so the row is formatted directly rather than via the generic (and
+        # escaping-aware) csv writer; that's reserved for the header.
+        row = f"{self._timestamp(entry.time)},{entry.value},{entry.unit}\r\n"
+        if self._debug:
+            _LOGGER.debug("writing row to CSV file", extra={"row": row})
+        return row
+
+    def _write(self, entry: CSVRow):
+        self._ensure_writable()
+        self._buffer.append(self._format(entry))
+        if len(self._buffer) >= self.batch_size:
+            self._flush()
+
+    def _flush(self):
+        if self._buffer:
+            # One join and a single write() per flush, rather than a write
+            # call (and its trip through the io stack) per buffered row.
+            self.output.write(''.join(self._buffer))
+            self._buffer.clear()
 
     def stop(self):
         """closes the file for writing and marks itself as finished."""
         _LOGGER.debug("csv logging stopping: closing file")
         if self.writing:
+            self._flush()
             self.output.close()
             self.writing = False
 
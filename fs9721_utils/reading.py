@@ -7,10 +7,7 @@ from __future__ import annotations
 import logging
 from collections import namedtuple
 from enum import Enum, auto
-from math import floor
-from typing import List, OrderedDict
-
-from bitstruct import unpack
+from typing import Iterable, List, Union
 
 _LOGGER = logging.getLogger("fs9721")
 
@@ -57,33 +54,30 @@ class Unit(Enum):
     HERTZ = auto()
 
 
-def readable_unit(units: List[Unit], with_prefixes=True) -> str:
-    """returns a string representation of the reading's units - i.e. 'mV'."""
-    parts = [None, None]
+_UNIT_PREFIXES = {
+    Unit.NANO: 'n', Unit.MICRO: 'u', Unit.MILLI: 'm',
+    Unit.KILO: 'k', Unit.MEGA: 'm'
+}
 
-    unit_prefixes = {
-        Unit.NANO: 'n', Unit.MICRO: 'u', Unit.MILLI: 'm',
-        Unit.KILO: 'k', Unit.MEGA: 'm'
-    }
+_UNIT_SYMBOLS = {
+    Unit.VOLT: 'V', Unit.AMP: 'A', Unit.OHM: 'Ohm', Unit.PERCENT: '%',
+    Unit.FAHRENHEIGHT: 'F', Unit.CELSIUS: 'C', Unit.HERTZ: 'Hz'
+}
 
-    unit_symbols = {
-        Unit.VOLT: 'V', Unit.AMP: 'A', Unit.OHM: 'Ohm', Unit.PERCENT: '%',
-        Unit.FAHRENHEIGHT: 'F', Unit.CELSIUS: 'C', Unit.HERTZ: 'Hz'
-    }
 
-    for val in units:
-        prefix = unit_prefixes.get(val)
-        if with_prefixes and prefix:
-            parts[0] = prefix
-            continue
+def readable_unit(units: List[Unit], with_prefixes=True) -> str:
+    """returns a string representation of the reading's units - i.e. 'mV'."""
+    prefix = symbol = ''
 
-        symbol = unit_symbols.get(val)
-        if symbol:
-            parts[1] = symbol
-            continue
+    for val in units:
+        if with_prefixes:
+            prefix = _UNIT_PREFIXES.get(val, prefix)
+        symbol = _UNIT_SYMBOLS.get(val, symbol)
 
-    _LOGGER.debug("got parts for units", extra={"units": units, "parts": parts})
-    return ''.join([p for p in parts if p])
+    _LOGGER.debug("got parts for units", extra={
+        "units": units, "parts": [prefix, symbol]
+    })
+    return prefix + symbol
 
 
 def readable_raw_value(units: List[Unit], val: float) -> float:
@@ -105,109 +99,171 @@ def readable_raw_value(units: List[Unit], val: float) -> float:
     return val
 
 
-_PACKET_SPEC = OrderedDict()
-_PACKET_SPEC["ac"] = _PacketParameter(
-    type=_PacketParameterType.FLAG, value=Flag.AC, width=1
-)
-_PACKET_SPEC["dc"] = _PacketParameter(
-    type=_PacketParameterType.FLAG, value=Flag.DC, width=1
-)
-_PACKET_SPEC["auto"] = _PacketParameter(
-    type=_PacketParameterType.FLAG, value=Flag.AUTO, width=1
-)
-_PACKET_SPEC["connected"] = _PacketParameter(
-    type=_PacketParameterType.FLAG, value=Flag.CONNECTED, width=1
-)
-_PACKET_SPEC["negative"] = _PacketParameter(
-    type=_PacketParameterType.VALUE, value=None, width=1
-)
-_PACKET_SPEC["digit1"] = _PacketParameter(
-    type=_PacketParameterType.VALUE, value=None, width=7
-)
-_PACKET_SPEC["dp1"] = _PacketParameter(
-    type=_PacketParameterType.VALUE, value=None, width=1
-)
-_PACKET_SPEC["digit2"] = _PacketParameter(
-    type=_PacketParameterType.VALUE, value=None, width=7
-)
-_PACKET_SPEC["dp2"] = _PacketParameter(
-    type=_PacketParameterType.VALUE, value=None, width=1
-)
-_PACKET_SPEC["digit3"] = _PacketParameter(
-    type=_PacketParameterType.VALUE, value=None, width=7
-)
-_PACKET_SPEC["dp3"] = _PacketParameter(
-    type=_PacketParameterType.VALUE, value=None, width=1
-)
-_PACKET_SPEC["digit4"] = _PacketParameter(
-    type=_PacketParameterType.VALUE, value=None, width=7
-)
-_PACKET_SPEC["micro"] = _PacketParameter(
-    type=_PacketParameterType.UNIT, value=Unit.MICRO, width=1
-)
-_PACKET_SPEC["nano"] = _PacketParameter(
-    type=_PacketParameterType.UNIT, value=Unit.NANO, width=1
-)
-_PACKET_SPEC["kilo"] = _PacketParameter(
-    type=_PacketParameterType.UNIT, value=Unit.KILO, width=1
-)
-_PACKET_SPEC["diode"] = _PacketParameter(
-    type=_PacketParameterType.FLAG, value=Flag.DIODE, width=1
-)
-_PACKET_SPEC["milli"] = _PacketParameter(
-    type=_PacketParameterType.UNIT, value=Unit.MILLI, width=1
-)
-_PACKET_SPEC["percent"] = _PacketParameter(
-    type=_PacketParameterType.UNIT, value=Unit.PERCENT, width=1
-)
-_PACKET_SPEC["mega"] = _PacketParameter(
-    type=_PacketParameterType.UNIT, value=Unit.MEGA, width=1
-)
-_PACKET_SPEC["continuity"] = _PacketParameter(
-    type=_PacketParameterType.FLAG, value=Flag.CONTINUITY, width=1
-)
-_PACKET_SPEC["capacitance"] = _PacketParameter(
-    type=_PacketParameterType.FLAG, value=Flag.CAPACITANCE, width=1
-)
-_PACKET_SPEC["ohm"] = _PacketParameter(
-    type=_PacketParameterType.UNIT, value=Unit.OHM, width=1
-)
-_PACKET_SPEC["relative"] = _PacketParameter(
-    type=_PacketParameterType.FLAG, value=Flag.RELATIVE, width=1
-)
-_PACKET_SPEC["hold"] = _PacketParameter(
-    type=_PacketParameterType.VALUE, value=Flag.HOLD, width=1
-)
-_PACKET_SPEC["amp"] = _PacketParameter(
-    type=_PacketParameterType.UNIT, value=Unit.AMP, width=1
-)
-_PACKET_SPEC["volts"] = _PacketParameter(
-    type=_PacketParameterType.UNIT, value=Unit.VOLT, width=1
-)
-_PACKET_SPEC["hertz"] = _PacketParameter(
-    type=_PacketParameterType.UNIT, value=Unit.HERTZ, width=1
-)
-_PACKET_SPEC["low_battery"] = _PacketParameter(
-    type=_PacketParameterType.VALUE, value=Flag.LOW_BATTERY, width=1
-)
-_PACKET_SPEC["minimum"] = _PacketParameter(
-    type=_PacketParameterType.VALUE, value=Flag.MINIMUM, width=1
-)
-_PACKET_SPEC["celsius"] = _PacketParameter(
-    type=_PacketParameterType.UNIT, value=Unit.CELSIUS, width=1
-)
-_PACKET_SPEC["fahrenheight"] = _PacketParameter(
-    type=_PacketParameterType.UNIT, value=Unit.FAHRENHEIGHT, width=1
-)
-_PACKET_SPEC["maximum"] = _PacketParameter(
-    type=_PacketParameterType.VALUE, value=Flag.MAXIMUM, width=1
-)
+_PACKET_SPEC = {
+    "ac": _PacketParameter(type=_PacketParameterType.FLAG, value=Flag.AC, width=1),
+    "dc": _PacketParameter(type=_PacketParameterType.FLAG, value=Flag.DC, width=1),
+    "auto": _PacketParameter(type=_PacketParameterType.FLAG, value=Flag.AUTO, width=1),
+    "connected": _PacketParameter(type=_PacketParameterType.FLAG, value=Flag.CONNECTED, width=1),
+    "negative": _PacketParameter(type=_PacketParameterType.VALUE, value=None, width=1),
+    "digit1": _PacketParameter(type=_PacketParameterType.VALUE, value=None, width=7),
+    "dp1": _PacketParameter(type=_PacketParameterType.VALUE, value=None, width=1),
+    "digit2": _PacketParameter(type=_PacketParameterType.VALUE, value=None, width=7),
+    "dp2": _PacketParameter(type=_PacketParameterType.VALUE, value=None, width=1),
+    "digit3": _PacketParameter(type=_PacketParameterType.VALUE, value=None, width=7),
+    "dp3": _PacketParameter(type=_PacketParameterType.VALUE, value=None, width=1),
+    "digit4": _PacketParameter(type=_PacketParameterType.VALUE, value=None, width=7),
+    "micro": _PacketParameter(type=_PacketParameterType.UNIT, value=Unit.MICRO, width=1),
+    "nano": _PacketParameter(type=_PacketParameterType.UNIT, value=Unit.NANO, width=1),
+    "kilo": _PacketParameter(type=_PacketParameterType.UNIT, value=Unit.KILO, width=1),
+    "diode": _PacketParameter(type=_PacketParameterType.FLAG, value=Flag.DIODE, width=1),
+    "milli": _PacketParameter(type=_PacketParameterType.UNIT, value=Unit.MILLI, width=1),
+    "percent": _PacketParameter(
+        type=_PacketParameterType.UNIT, value=Unit.PERCENT, width=1
+    ),
+    "mega": _PacketParameter(type=_PacketParameterType.UNIT, value=Unit.MEGA, width=1),
+    "continuity": _PacketParameter(type=_PacketParameterType.FLAG, value=Flag.CONTINUITY, width=1),
+    "capacitance": _PacketParameter(
+        type=_PacketParameterType.FLAG, value=Flag.CAPACITANCE, width=1
+    ),
+    "ohm": _PacketParameter(type=_PacketParameterType.UNIT, value=Unit.OHM, width=1),
+    "relative": _PacketParameter(type=_PacketParameterType.FLAG, value=Flag.RELATIVE, width=1),
+    "hold": _PacketParameter(type=_PacketParameterType.VALUE, value=Flag.HOLD, width=1),
+    "amp": _PacketParameter(type=_PacketParameterType.UNIT, value=Unit.AMP, width=1),
+    "volts": _PacketParameter(type=_PacketParameterType.UNIT, value=Unit.VOLT, width=1),
+    "hertz": _PacketParameter(type=_PacketParameterType.UNIT, value=Unit.HERTZ, width=1),
+    "low_battery": _PacketParameter(
+        type=_PacketParameterType.VALUE, value=Flag.LOW_BATTERY, width=1
+    ),
+    "minimum": _PacketParameter(type=_PacketParameterType.VALUE, value=Flag.MINIMUM, width=1),
+    "celsius": _PacketParameter(type=_PacketParameterType.UNIT, value=Unit.CELSIUS, width=1),
+    "fahrenheight": _PacketParameter(
+        type=_PacketParameterType.UNIT, value=Unit.FAHRENHEIGHT, width=1
+    ),
+    "maximum": _PacketParameter(type=_PacketParameterType.VALUE, value=Flag.MAXIMUM, width=1),
+}
+
+
+def _field_shifts():
+    """
+    Computes each spec field's (shift, mask) into the 56-bit packet value,
+    accumulating widths from the MSB down in declaration order.
+    """
+    shifts = []
+    offset = 0
+    for param in _PACKET_SPEC.values():
+        shifts.append((56 - offset - param.width, (1 << param.width) - 1))
+        offset += param.width
+
+    return tuple(shifts)
 
 
-_PACKET_PARSE_STR = ''.join([f"u{p.width}" for p in _PACKET_SPEC.values()])
+_FIELD_SHIFTS = _field_shifts()
 
 
-_PacketParams = namedtuple("_PacketParams", _PACKET_SPEC.keys())
+def _compile_unpacker():
+    """
+    Generates an unpacking function specialised to `_PACKET_SPEC`: the widths
+    in the spec are known at import time, so each field reduces to a constant
+    shift-and-mask against the packet data read as a single 56-bit integer.
+    The result is a plain tuple in spec declaration order. The argument is
+    the packet data as a single 56-bit integer (MSB first).
+    """
+    fields = ", ".join(f"(v >> {s}) & {m}" for s, m in _FIELD_SHIFTS)
+    source = (
+        "def _fast_unpack(v):\n"
+        f"    return ({fields})\n"
+    )
+
+    namespace = {}
+    exec(source, namespace)  # pylint: disable=exec-used
+    return namespace["_fast_unpack"]
+
+
+_fast_unpack = _compile_unpacker()
+
+# The data nibble of the byte with (0-based) index i sits at bits
+# [52 - 4i, 52 - 4i + 4) of the 56-bit value - even indices supply the high
+# nibble of each data byte, odd indices the low nibble.
+_NIBBLE_SHIFTS = tuple(52 - (4 * i) for i in range(14))
+
+# Constants for the in-order fast path: when the counter nibbles are already
+# sequential (the overwhelmingly common case), the whole packet validates
+# with one masked compare against the expected counter pattern, and the 14
+# data nibbles compact into the 56-bit value with four shift-and-OR folds -
+# no per-byte Python loop. Out-of-order packets fall back to the loop.
+_INDEX_MASK = int("F0" * 14, 16)
+_INDEX_EXPECTED = int("".join(f"{i:X}0" for i in range(1, 15)), 16)
+_DATA_MASK = int("0F" * 14, 16)
+_NIBBLE_FOLDS = (
+    (4, int("00FF" * 7, 16)),
+    (8, int("0000FFFF" * 4, 16)),
+    (16, int("00000000FFFFFFFF" * 2, 16)),
+    (32, (1 << 64) - 1)
+)
+
+
+# Positions of each spec field within the state tuple; resolved once here so
+# the accessors below can index the tuple directly rather than walking the
+# spec (and paying an attribute lookup per field) on every call.
+_FIELD_INDEX = {name: idx for idx, name in enumerate(_PACKET_SPEC)}
+
+_UNIT_INDICES = [
+    (idx, param.value) for idx, param in enumerate(_PACKET_SPEC.values())
+    if param.type is _PacketParameterType.UNIT
+]
+
+_FLAG_INDICES = [
+    (idx, param.value) for idx, param in enumerate(_PACKET_SPEC.values())
+    if param.type is _PacketParameterType.FLAG
+]
+
+# 7-bit segment values map straight into a 128-entry table: indexing replaces
+# a dict lookup (and its per-call construction) in display(). Unrecognised
+# glyphs render as an empty string, just as the old dict's default did.
+_SEG_TABLE = [''] * 128
+for _value, _char in {
+    0x7D: "0", 0x05: "1", 0x5B: "2", 0x1F: "3", 0x27: "4", 0x3E: "5",
+    0x7E: "6", 0x15: "7", 0x7F: "8", 0x3F: "9", 0x68: "L"
+}.items():
+    _SEG_TABLE[_value] = _char
+_SEG_TABLE = tuple(_SEG_TABLE)
+
+_IDX_NEGATIVE = _FIELD_INDEX["negative"]
+_IDX_DIGIT1 = _FIELD_INDEX["digit1"]
+_IDX_DP1 = _FIELD_INDEX["dp1"]
+_IDX_DIGIT2 = _FIELD_INDEX["digit2"]
+_IDX_DP2 = _FIELD_INDEX["dp2"]
+_IDX_DIGIT3 = _FIELD_INDEX["digit3"]
+_IDX_DP3 = _FIELD_INDEX["dp3"]
+_IDX_DIGIT4 = _FIELD_INDEX["digit4"]
+
+# Companion table to _SEG_TABLE holding each glyph's numeric value, for
+# computing value() without a round-trip through the display string. Blank
+# (or unrecognised) glyphs contribute no digit - mirroring their absence from
+# the display string - and "L" marks the reading as non-numeric.
+_SEG_BLANK = -1
+_SEG_OVERLOAD = -2
+
+_SEG_DIGIT = [_SEG_BLANK] * 128
+for _value, _digit in {
+    0x7D: 0, 0x05: 1, 0x5B: 2, 0x1F: 3, 0x27: 4, 0x3E: 5,
+    0x7E: 6, 0x15: 7, 0x7F: 8, 0x3F: 9
+}.items():
+    _SEG_DIGIT[_value] = _digit
+_SEG_DIGIT[0x68] = _SEG_OVERLOAD
+_SEG_DIGIT = tuple(_SEG_DIGIT)
+
+# The digits in display order, each paired with the decimal point that
+# precedes it; a set decimal point makes the digits that follow fractional.
+_DIGIT_ORDER = (
+    (None, _IDX_DIGIT1), (_IDX_DP1, _IDX_DIGIT2),
+    (_IDX_DP2, _IDX_DIGIT3), (_IDX_DP3, _IDX_DIGIT4)
+)
+
+
+# Cached in place of Reading._value when the display can't be read as a
+# number, so repeated value() calls skip the failed parse as well.
+_NOT_NUMERIC = object()
 
 
 class InvalidPacketError(Exception):
@@ -232,54 +288,64 @@ class Reading:
     Packets that arrive with their bytes in an incorrect order can still be parsed
     by the Reading, as long as the indexing bits (i.e. higher 4 bits of each byte)
     are intact and valid.
+
+    The packet may be any bytes-like object (`bytes`, `bytearray`,
+    `memoryview`) or an iterable of ints; `bytes` input is consumed as-is
+    without copying.
     """
-    def __init__(self, packet: bytearray):
+    __slots__ = ("state", "_display", "_value")
+
+    def __init__(self, packet: Union[bytes, bytearray, Iterable[int]]):
+        if not isinstance(packet, bytes):
+            packet = bytes(packet)
+
         if len(packet) != 14:
             _LOGGER.error("invalid packet: incorrect length", extra={
                 "length": len(packet), "data": packet
             })
             raise InvalidPacketError(f"invalid payload: incorrect length ({len(packet)} bytes)")
 
-        seen = [False for _ in range(0, 14)]
-
-        packet_data = bytearray(7)
-        for byte in packet:
-            # MSB 4 bits are used to index the byte; with a value between 0x01 and 0x014
-            byte_idx = (byte >> 4)
-            if (not 14 >= byte_idx >= 1) or seen[(byte_idx-1)]:
-                _LOGGER.error("packet invalid: validation of counter failed", extra={
-                    "data": packet
+        whole = int.from_bytes(packet, "big")
+        if (whole & _INDEX_MASK) == _INDEX_EXPECTED:
+            # The bytes arrived in counter order, so validation collapses to
+            # the masked compare above and the data nibbles compact pairwise
+            # (nibbles -> bytes -> words ...) down into the 56-bit value.
+            packet_data = whole & _DATA_MASK
+            for shift, mask in _NIBBLE_FOLDS:
+                packet_data = (packet_data | (packet_data >> shift)) & mask
+        else:
+            seen_mask = 0
+            packet_data = 0
+            for byte in packet:
+                # MSB 4 bits are used to index the byte; with a value between 0x01 and 0x014
+                byte_idx = (byte >> 4)
+                bit = 1 << byte_idx
+                if (not 14 >= byte_idx >= 1) or (seen_mask & bit):
+                    _LOGGER.error("packet invalid: validation of counter failed", extra={
+                        "data": packet
+                    })
+                    raise InvalidPacketError(
+                        f"invalid or duplicate byte index recieved: {byte_idx}"
+                    )
+
+                # Track the index in a bitmask, and OR the lower 4 bits of data
+                # (i.e. 0b0000xxxx) straight into place within the 56-bit value.
+                seen_mask |= bit
+                packet_data |= (byte & 0x0F) << _NIBBLE_SHIFTS[byte_idx - 1]
+
+            if seen_mask != 0x7FFE:
+                _LOGGER.error("packet invalid: duplicate bytes", extra={
+                    "data": packet, "seen": seen_mask
                 })
-                raise InvalidPacketError(f"invalid or duplicate byte index recieved: {byte_idx}")
-
-            # Revert to "normal" 0-based indexing now the byte index has been
-            # validated
-            idx = (byte_idx - 1)
-            seen[idx] = True
-
-            # Zero out the four higher bits that contained the index (i.e. 0b0000xxxx)
-            byte &= 0x0F
-
-            # Two packet bytes make-up one data byte when indexing is removed,
-            # so every second iteration sets the MSB. (i.e. 0bxxxx0000)
-            if (idx % 2) == 0:
-                byte <<= 4
-
-            packet_data[floor(idx/2)] |= byte
-
-        if not all(seen):
-            _LOGGER.error("packet invalid: duplicate bytes", extra={
-                "data": packet, "seen": seen
-            })
-            raise InvalidPacketError("duplicate bytes present in the packet")
+                raise InvalidPacketError("duplicate bytes present in the packet")
 
         _LOGGER.debug("parsed packet structure from raw packet data", extra={
             "raw": packet, "parsed": packet_data
         })
 
-        self.state = _PacketParams(
-            *(unpack(_PACKET_PARSE_STR, packet_data))
-        )
+        self.state = _fast_unpack(packet_data)
+        self._display = None
+        self._value = None
 
         _LOGGER.info("parsed parameters and reading from inbound packet", extra={
             "readings": self.state
@@ -287,25 +353,19 @@ class Reading:
 
     def display(self) -> str:
         """Returns a string representation of the reading from the devices LCD."""
-        char_map = {
-            0x7D: "0", 0x05: "1", 0x5B: "2", 0x1F: "3", 0x27: "4", 0x3E: "5",
-            0x7E: "6", 0x15: "7", 0x7F: "8", 0x3F: "9", 0x0: "", 0x68: "L"
-        }
-
-        def parse_digit(val):
-            return char_map.get(val, "")
-
-        def parse_dp(val):
-            return "." if val else ""
-
-        display = ''.join([
-            "-" if self.state.negative else "", parse_digit(self.state.digit1),
-            parse_dp(self.state.dp1), parse_digit(self.state.digit2),
-            parse_dp(self.state.dp2), parse_digit(self.state.digit3),
-            parse_dp(self.state.dp3), parse_digit(self.state.digit4)
-        ])
+        if self._display is not None:
+            return self._display
+
+        state = self.state
+        display = (
+            f"{'-' if state[_IDX_NEGATIVE] else ''}{_SEG_TABLE[state[_IDX_DIGIT1]]}"
+            f"{'.' if state[_IDX_DP1] else ''}{_SEG_TABLE[state[_IDX_DIGIT2]]}"
+            f"{'.' if state[_IDX_DP2] else ''}{_SEG_TABLE[state[_IDX_DIGIT3]]}"
+            f"{'.' if state[_IDX_DP3] else ''}{_SEG_TABLE[state[_IDX_DIGIT4]]}"
+        )
 
         _LOGGER.debug("parsed display reading", extra={"display": display})
+        self._display = display
         return display
 
     def value(self) -> float:
@@ -313,25 +373,64 @@ class Reading:
         Returns a numerical representation of the devices read value.
         BEWARE: an exception may be raised (`ValueError`) when that value contains 'L'!
         """
-        try:
-            return float(self.display())
-        except ValueError as value_err:
-            _LOGGER.debug("attempted to cast multimeter value to float: not numeric!")
+        if self._value is _NOT_NUMERIC:
+            raise NonNumericReadingError(
+                f"{self.display()} is not a numeric reading - no suitable value"
+            )
+        if self._value is not None:
+            return self._value
+
+        state = self.state
+        mantissa = 0
+        scale = 1
+        digits = 0
+        points = 0
+
+        for dp_idx, digit_idx in _DIGIT_ORDER:
+            if dp_idx is not None and state[dp_idx]:
+                points += 1
+
+            digit = _SEG_DIGIT[state[digit_idx]]
+            if digit == _SEG_BLANK:
+                continue
+            if digit == _SEG_OVERLOAD:
+                digits = 0
+                break
+
+            mantissa = (mantissa * 10) + digit
+            digits += 1
+            if points:
+                scale *= 10
+
+        # A reading is only numeric when it has at least one digit and - as
+        # with a corrupt segment state - no more than one decimal point.
+        if not digits or points > 1:
+            _LOGGER.debug("attempted to read multimeter value: not numeric!")
+            self._value = _NOT_NUMERIC
             msg = f"{self.display()} is not a numeric reading - no suitable value"
-            raise NonNumericReadingError(msg) from value_err
+            raise NonNumericReadingError(msg)
+
+        # The sign is applied to the float, not the integer mantissa, so that
+        # a negative zero reading (i.e. "-0") keeps its sign as float() did.
+        value = mantissa / scale
+        self._value = -value if state[_IDX_NEGATIVE] else value
+        return self._value
 
     def units(self) -> List[Unit]:
         """Returns a List of `Unit` items associated with the payloads value."""
-        def has_unit(ident: str, param: _PacketParameter):
-            is_unit = (param.type == _PacketParameterType.UNIT)
-            return is_unit and (getattr(self.state, ident))
-
-        return [p.value for i, p in _PACKET_SPEC.items() if has_unit(i, p)]
+        state = self.state
+        return [unit for idx, unit in _UNIT_INDICES if state[idx]]
 
     def flags(self) -> List[Flag]:
         """Returns a List of `Flag` items for each flag detected in the payload."""
-        def has_flag(ident: str, param: _PacketParameter):
-            is_flag = (param.type == _PacketParameterType.FLAG)
-            return is_flag and (getattr(self.state, ident))
+        state = self.state
+        return [flag for idx, flag in _FLAG_INDICES if state[idx]]
+
 
-        return [p.value for i, p in _PACKET_SPEC.items() if has_flag(i, p)]
+def parse_batch(packets) -> List[Reading]:
+    """
+    Parses a sequence of raw packets in one call, returning a `Reading` for
+    each. Intended for offline replay of captured packet streams, where the
+    caller has the whole capture up-front rather than one packet at a time.
+    """
+    return [Reading(packet) for packet in packets]
@@ -52,4 +52,18 @@ def valid_expectations(random=False):
             "display": "0006",
             "as_csv": ["6.0", "C"]
         },
+        {
+            "sample": r([0x17, 0x2F, 0x3D, 0x47, 0x5D, 0x65, 0x7B, 0x8B, 0x9E, 0xA0, 0xB8, 0xC0, 0xD4, 0xE0]),
+            "units": [Unit.MILLI, Unit.VOLT],
+            "flags": [Flag.DC, Flag.AUTO, Flag.CONNECTED],
+            "display": "-002.5",
+            "as_csv": ["-2.5", "mV"]
+        },
+        {
+            "sample": r([0x17, 0x20, 0x30, 0x46, 0x58, 0x60, 0x70, 0x80, 0x90, 0xA0, 0xB0, 0xC0, 0xD4, 0xE0]),
+            "units": [Unit.VOLT],
+            "flags": [Flag.DC, Flag.AUTO, Flag.CONNECTED],
+            "display": "L",
+            "as_csv": ["L", "V"]
+        },
     ]
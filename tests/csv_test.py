@@ -1,14 +1,15 @@
 from csv import reader
 from datetime import datetime
 import enum
-from tempfile import TemporaryFile
+from os import path
+from tempfile import TemporaryDirectory, TemporaryFile
 from unittest.mock import patch
 import unittest
 
 from freezegun import freeze_time
 
 from fs9721_utils import Reading
-from fs9721_utils.csv_logger import CSVWriter
+from fs9721_utils.csv_logger import CSVRow, CSVWriter
 
 from .cases import valid_expectations
 
@@ -61,5 +62,44 @@ class TestCSVLogging(unittest.TestCase):
                 if idx == 0:
                     assert actual == _expected_header
                     continue
-                
+
                 assert actual == [_expected_timestamp] + test_expectations[idx-1]["as_csv"]
+
+    def test_logs_many_in_one_batch(self):
+        test_expectations = valid_expectations()
+
+        with TemporaryFile(mode='w+') as tmp:
+            with patch('fs9721_utils.csv_logger.open') as mo:
+                mo.return_value = tmp
+
+                # a large batch_size shows log_many flushing regardless of it
+                w = CSVWriter(batch_size=1024)
+                w.log_many(
+                    [Reading(case["sample"]) for case in test_expectations] +
+                    [CSVRow(time=datetime.now(), value=5, unit="V")]
+                )
+
+            expected = [case["as_csv"] for case in test_expectations] + [["5", "V"]]
+
+            tmp.seek(0)
+            rows = list(reader(tmp))
+            assert rows[0] == _expected_header
+            assert rows[1:] == [[_expected_timestamp] + e for e in expected]
+
+    def test_batched_writes_flush_on_stop(self):
+        with TemporaryDirectory() as tmpdir:
+            w = CSVWriter(filename=path.join(tmpdir, "batched.csv"), batch_size=4)
+
+            for i in range(0, 6):
+                w.log_value(value=i, unit="V")
+
+            # the first full batch has been written; the remainder is still
+            # buffered and should only reach the file once stop() flushes it
+            assert len(w._buffer) == 2
+            w.stop()
+
+            with open(w.filename) as csv_file:
+                rows = list(reader(csv_file))
+
+            expected = [[_expected_timestamp, str(i), "V"] for i in range(0, 6)]
+            assert rows == [_expected_header] + expected
@@ -1,7 +1,7 @@
 import unittest
 
-from fs9721_utils import Reading
-from fs9721_utils.reading import InvalidPacketError
+from fs9721_utils import Reading, parse_batch
+from fs9721_utils.reading import InvalidPacketError, NonNumericReadingError
 
 from .cases import _MALFORMED, valid_expectations
 
@@ -30,3 +30,48 @@ class TestPacketParsing(unittest.TestCase):
                 flags = meter.flags()
                 assert len(flags) == len(test["flags"])
                 assert all([f in flags for f in test["flags"]])
+
+    def test_parse_batch(self):
+        cases = valid_expectations()
+        readings = parse_batch([test["sample"] for test in cases])
+
+        assert len(readings) == len(cases)
+        for test, meter in zip(cases, readings):
+            assert isinstance(meter, Reading)
+            assert test["display"] == meter.display()
+
+    def test_parse_values(self):
+        for test in valid_expectations():
+            meter = Reading(test["sample"])
+
+            if test["as_csv"][0] == "L":
+                got_exception = False
+
+                try:
+                    meter.value()
+                except NonNumericReadingError:
+                    got_exception = True
+
+                assert got_exception
+                continue
+
+            assert float(test["as_csv"][0]) == meter.value()
+
+    def test_repeated_reads_are_stable(self):
+        for test in valid_expectations():
+            meter = Reading(test["sample"])
+            assert meter.display() == meter.display()
+
+            if test["as_csv"][0] == "L":
+                for _ in range(0, 2):
+                    got_exception = False
+
+                    try:
+                        meter.value()
+                    except NonNumericReadingError:
+                        got_exception = True
+
+                    assert got_exception
+                continue
+
+            assert meter.value() == meter.value()